@@ -2,36 +2,138 @@
 """
 
 # Standard library imports
+import atexit
+from dataclasses import dataclass
 from datetime import datetime
 from datetime import timedelta
+from functools import cached_property
+from functools import lru_cache
 import logging
+from logging.handlers import QueueHandler
+from logging.handlers import QueueListener
 from logging.handlers import SysLogHandler
 import netifaces
-from threading import Thread
+import os
+import queue
+import selectors
+import signal
 import socket
-from time import sleep
+import threading
+from time import monotonic
 
 # Third part imports
-import RPi.GPIO as GPIO
+import gpiod
+from gpiod.edge_event import EdgeEvent
+from gpiod.line import Bias, Direction, Edge, Value
 
 # Local application imports
+from app.Email import Email
 from app.Event import Event
 
+# GPIO character device that exposes the Raspberry Pi header pins
+GPIO_CHIP = "/dev/gpiochip0"
+
+# Seconds shutdown() waits for the event thread to alert queued events
+SHUTDOWN_TIMEOUT = 60
+
+class _DeferredQueueHandler(QueueHandler):
+    """QueueHandler that enqueues records unformatted so that message 
+    formatting happens on the QueueListener thread instead of the caller."""
+
+    def prepare(self, record):
+        """Returns record as is."""
+
+        return record
+
+class _BoardFormatter(logging.Formatter):
+    """Formatter that renders "asctime - threadName - module - levelname : 
+    message" and caches the parts that repeat between records.
+
+    The prefix is cached per thread, module, and level and the timestamp is 
+    cached per second. Used only from the QueueListener thread.
+    """
+
+    def __init__(self):
+        super().__init__(datefmt="%Y-%m-%d %H:%M:%S")
+        self.__prefixes = {}
+        self.__second = None
+        self.__asctime = None
+
+    def formatTime(self, record, datefmt=None):
+        """Returns timestamp of record, formatted once per second."""
+
+        second = int(record.created)
+        if second != self.__second:
+            self.__asctime = super().formatTime(record, self.datefmt)
+            self.__second = second
+        return self.__asctime
+
+    def format(self, record):
+        """Returns record formatted as a log line."""
+
+        key = (record.threadName, record.module, record.levelname)
+        prefix = self.__prefixes.get(key)
+        if prefix is None:
+            prefix = self.__prefixes[key] = " - ".join(key) + " : "
+
+        line = f"{self.formatTime(record)} - {prefix}{record.getMessage()}"
+
+        # Append exception and stack details as logging.Formatter does
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            line += "\n" + record.exc_text
+        if record.stack_info:
+            line += "\n" + self.formatStack(record.stack_info)
+        return line
+
+@dataclass(frozen=True)
+class _NetInfo:
+    """Hostname and IP of the Raspberry Pi, constant for the process."""
+
+    hostname: str
+    ip: str
+
+@lru_cache(maxsize=1)
+def _net_info():
+    """Looks up the hostname and eth0 IP once and returns them as _NetInfo."""
+
+    return _NetInfo(socket.gethostname(), 
+        netifaces.ifaddresses("eth0")[2][0]["addr"])
+
 class Board:
     """Class that represents a Raspberry Pi board with GPIO pins.
 
     Attributes
     ----------
         pin : int
-            Pin number to monitor
+            GPIO line offset (BCM numbering) of the pin to monitor
         hostname : str
             Hostname of the Raspberry Pi
         ip : str
             IP of the Raspberry Pi
         input_status : int
             Pin input value
+        state_changed : threading.Event
+            Set by monitor() when the pin input status next changes
         board_logger : Logger
             Logger object to log to console
+        log_listener : QueueListener
+            Background listener that writes queued log records to handlers
+        log_handler : QueueHandler
+            Handler on board_logger that queues records for log_listener
+        line_request : LineRequest
+            gpiod request that holds the monitored pin
+        events : queue.SimpleQueue
+            Queue of event descriptors waiting to be alerted
+        event_thread : Thread
+            Persistent thread that alerts queued events in order
+        email_retries : queue.SimpleQueue
+            Queue of failed IT team emails waiting to be retried
+        retries_stopped : threading.Event
+            Set by shutdown() to stop retrying IT team emails
+        retry_thread : Thread
+            Persistent thread that retries queued IT team emails one at a time
     Methods
     -------
         get_hostname()
@@ -44,6 +146,8 @@ class Board:
             Sets up and initializes the GPIO board
         monitor()
             Monitors GPIO board to detect for changes on pin
+        shutdown()
+            Stops event alerts and releases the pin
         alert()
             Creates a new Event object to send appropriate communications
         check_alert()
@@ -56,13 +160,22 @@ class Board:
         Parameters
         ---------
         pin : int
-            Pin number to monitor
+            GPIO line offset (BCM numbering) of the pin to monitor
         """
         self.__pin = pin
-        self.__hostname = socket.gethostname()
-        self.__ip = netifaces.ifaddresses("eth0")[2][0]["addr"]
         self.__input_status = None    # Set to None as monitor() will initialize
+        self.__state_changed = threading.Event()
         self.__board_logger = self.__init_board_logger()
+        self.__line_request = None    # Set to None as setup() will initialize
+        self.__events = queue.SimpleQueue()
+        self.__event_thread = threading.Thread(target=self.__consume, 
+            name="EventThread", daemon=True)
+        self.__event_thread.start()
+        self.__email_retries = queue.SimpleQueue()
+        self.__retries_stopped = threading.Event()
+        self.__retry_thread = threading.Thread(target=self.__retry_emails, 
+            name="EmailRetryThread", daemon=True)
+        self.__retry_thread.start()
 
     def __init_board_logger(self):
         """Creates, configures, and returns a Logger object."""
@@ -71,31 +184,47 @@ class Board:
         board_logger = logging.getLogger(__name__)
         board_logger.setLevel(logging.DEBUG)
 
-        # Create a handler to console and set level
+        # Create a formatter shared by both handlers; Both run on the 
+        # listener thread
+        board_format = _BoardFormatter()
+
+        # Create a handler to console, set level, and add formatter
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.INFO)
+        console_handler.setFormatter(board_format)
 
-        # Create a formatter and add it to the handler
-        console_format = logging.Formatter("%(asctime)s - %(threadName)s - "
-            + "%(module)s - %(levelname)s : %(message)s")
-        console_handler.setFormatter(console_format)
-
-        # Create a handler for syslog and set level
+        # Create a handler for syslog, set level, and add formatter
         syslog_handler = SysLogHandler("/dev/log")
         syslog_handler.setLevel(logging.INFO)
+        syslog_handler.setFormatter(board_format)
 
-        # Create a formatter and add it to handler
-        syslog_format = logging.Formatter("%(asctime)s - %(threadName)s - "
-           + "%(module)s -  %(levelname)s : %(message)s")
-        syslog_handler.setFormatter(syslog_format)
+        # Write to console and syslog from a background listener thread so 
+        # logging calls only enqueue the record
+        log_queue = queue.SimpleQueue()
+        self.__log_listener = QueueListener(log_queue, console_handler, 
+            syslog_handler, respect_handler_level=True)
+        self.__log_listener.start()
+        atexit.register(self.__log_listener.stop)
 
-        # Add handlers to logger
-        board_logger.addHandler(console_handler)
-        board_logger.addHandler(syslog_handler)
+        # Add queue handler to logger
+        self.__log_handler = _DeferredQueueHandler(log_queue)
+        board_logger.addHandler(self.__log_handler)
 
         # Return logger
         return board_logger
     
+    @cached_property
+    def __hostname(self):
+        """Hostname looked up on first use"""
+
+        return _net_info().hostname
+
+    @cached_property
+    def __ip(self):
+        """IP address looked up on first use"""
+
+        return _net_info().ip
+
     def get_hostname(self):
         """Return hostname"""
         
@@ -133,21 +262,29 @@ class Board:
         )
         
     def setup(self):
-        """Sets the Raspberry Pi GPIO board mode and establishes pin as input in 
-        order to monitor pin for changes.
+        """Requests the pin from the GPIO chip as an input with edge detection
+        in order to monitor pin for changes.
         """
-        
-        # Board refers to the P1 header of the Raspberry Pi board
-        GPIO.setmode(GPIO.BOARD)
 
-        # Set up pin as an input with a pull up resistor to 3.3V
-        GPIO.setup(self.__pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
+        # Set up pin as an input with a pull up resistor to 3.3V and report 
+        # both rising and falling edges; The kernel debounces edges for 5ms
+        settings = gpiod.LineSettings(direction=Direction.INPUT, 
+            bias=Bias.PULL_UP, edge_detection=Edge.BOTH, 
+            debounce_period=timedelta(milliseconds=5))
+
+        self.__line_request = gpiod.request_lines(GPIO_CHIP, 
+            consumer="minus80", config={self.__pin: settings})
+
+    def __read_pin(self):
+        """Returns current value of the pin as an int."""
+
+        return int(self.__line_request.get_value(self.__pin) == Value.ACTIVE)
 
     def monitor(self):
         """Monitors pin for changes. 
         
-        If a change is detected, spawn a new thread and alert via an Event
-        object. Function is inifinite and never ends.
+        If a change is detected, alert via an Event object on the event 
+        thread. Function runs until SIGTERM is received.
         """
 
         # Log beginning of process
@@ -156,34 +293,109 @@ class Board:
             self.__pin)
  
         # Set input status of pin for board object
-        self.set_input_status(GPIO.input(self.__pin))
+        self.set_input_status(self.__read_pin())
         status = "ALARM" if self.get_input_status() else "RECOVERY"
         board_logger.info("Initital status: %s", status)
 
         # Deal with an error status upon power failure
         if self.get_input_status() == 1: self.initiate_event()
 
-        # Monitor pin until KeyBoardInterrupt is detected
-        while True:
-
-            # Log monitoring
-            board_logger.info("Monitoring for pin changes...")
-            
-            # Wait for a change in pin status
-            GPIO.wait_for_edge(self.__pin, GPIO.BOTH)
-
-            sleep(0.005) #debounce for 5ms
-
-            if self.get_input_status() != GPIO.input(self.__pin):
+        # Wake up only when the kernel has queued edge events for the pin or 
+        # a signal is caught; Python writes the signal number to the wakeup 
+        # pipe even when the signal interrupts another thread
+        stop_fd, stop_write_fd = os.pipe()
+        os.set_blocking(stop_write_fd, False)
+        previous_wakeup_fd = signal.set_wakeup_fd(stop_write_fd)
+        previous_handler = signal.signal(signal.SIGTERM, 
+            lambda signum, frame: None)
+        selector = selectors.DefaultSelector()
+        selector.register(self.__line_request.fd, selectors.EVENT_READ)
+        selector.register(stop_fd, selectors.EVENT_READ)
+
+        # Monitor pin until SIGTERM or KeyBoardInterrupt is detected
+        try:
+            while True:
+
+                # Log monitoring
+                board_logger.info("Monitoring for pin changes...")
                 
-                # Set input status of pin
-                self.set_input_status(GPIO.input(self.__pin))
-
-                # Initiate event
-                self.initiate_event()
+                # Wait for a change in pin status or a stop request
+                ready = {key.fd for key, mask in selector.select()}
+
+                if stop_fd in ready:
+                    if signal.SIGTERM in os.read(stop_fd, 512):
+                        board_logger.info("Stop requested; ending monitor of "
+                            "pin %s.", self.__pin)
+                        break
+                    continue
+
+                # Drain pending debounced edges; Last edge carries the new 
+                # level of the pin
+                edge_events = self.__line_request.read_edge_events()
+                input_status = int(edge_events[-1].event_type 
+                    == EdgeEvent.Type.RISING_EDGE)
+
+                if self.get_input_status() != input_status:
+                    
+                    # Set input status of pin, wake any check alert cycle and 
+                    # start tracking the next change
+                    self.set_input_status(input_status)
+                    self.__state_changed.set()
+                    self.__state_changed = threading.Event()
+
+                    # Initiate event
+                    self.initiate_event()
+        finally:
+            # Restore SIGTERM handler and wakeup fd before the pipe is closed
+            signal.signal(signal.SIGTERM, previous_handler)
+            signal.set_wakeup_fd(previous_wakeup_fd)
+            selector.close()
+            os.close(stop_fd)
+            os.close(stop_write_fd)
+            self.shutdown()
+
+    def shutdown(self):
+        """Ends any check alert cycle, stops the event and retry threads, 
+        releases the pin, and stops logging through this board's listener."""
+
+        # Wake check alert cycles so they end instead of waiting out the hour
+        # and stop event thread after queued events
+        self.__state_changed.set()
+        self.__events.put(None)
+
+        # Give queued events, such as a RECOVERY, time to be alerted
+        self.__event_thread.join(timeout=SHUTDOWN_TIMEOUT)
+        if self.__event_thread.is_alive():
+            self.__board_logger.warning("Event thread still alerting after "
+                "%s seconds; Queued events may not be alerted.", 
+                SHUTDOWN_TIMEOUT)
+
+        # Stop retrying IT team emails; Retries still queued are logged as 
+        # dropped
+        self.__retries_stopped.set()
+        self.__email_retries.put(None)
+        self.__retry_thread.join(timeout=SHUTDOWN_TIMEOUT)
+        if self.__retry_thread.is_alive():
+            self.__board_logger.warning("Retry thread still sending after "
+                "%s seconds; IT team email may not be sent.", 
+                SHUTDOWN_TIMEOUT)
+
+        if self.__line_request is not None:
+            self.__line_request.release()
+            self.__line_request = None
+
+        Email.close_connections()
+
+        # Flush queued log records and detach this board from the shared 
+        # logger
+        if self.__log_listener is not None:
+            self.__board_logger.removeHandler(self.__log_handler)
+            atexit.unregister(self.__log_listener.stop)
+            self.__log_listener.stop()
+            self.__log_listener = None
 
     def initiate_event(self):
-        """Creates a new Thread object with the alert function as a target. """
+        """Queues an event descriptor for the event thread to alert. """
 
         # Determine and log status change
         status = "ALARM; initiating alarm event." \
@@ -192,69 +404,134 @@ class Board:
         self.get_board_logger().info("Pin input status changed to %s", \
             status)
 
-        # Create thread to handle event alert
-        event_thread = Thread(target=self.alert, args=(), \
-            name="EventThread")
-        
-        event_thread.start()
+        # Queue event with its status, time, and the Event that signals the 
+        # status has since changed
+        self.__events.put((self.get_input_status(), datetime.now(), 
+            self.__state_changed))
+
+    def __consume(self):
+        """Alerts queued events in order until shutdown() queues None."""
+
+        while True:
+            event_descriptor = self.__events.get()
+            if event_descriptor is None:
+                break
+
+            try:
+                self.alert(*event_descriptor)
+            except Exception as error:
+                self.get_board_logger().error("Event alert failed: %s", error)
+
+    def __retry_emails(self):
+        """Retries failed IT team emails in order until shutdown() queues 
+        None.
+
+        An email identical to the one before it, such as from each resend of 
+        the same alarm, is merged into that retry.
+        """
+
+        board_logger = self.get_board_logger()
+        last_message = None
+        while True:
+            retry = self.__email_retries.get()
+            if retry is None:
+                break
 
-    def alert(self):
-        """Creates an Event object to send appropriate alerts. """
+            # Skip duplicate of the email already retried
+            event, email = retry
+            message = str(email)
+            if message == last_message:
+                continue
+            last_message = message
+
+            if self.__retries_stopped.is_set():
+                board_logger.critical("Shutting down; dropping email to %s.", 
+                    email.get_recipient())
+                continue
+
+            try:
+                event.handle_email_error(email, board_logger, 
+                    self.__retries_stopped)
+            except Exception as error:
+                board_logger.error("Email retry failed: %s", error)
+
+    def alert(self, input_status, event_time, state_changed):
+        """Creates an Event object to send appropriate alerts.
+
+        Parameters
+        ----------
+            input_status : int
+                Pin input value of the event
+            event_time : datetime
+                Time the pin input status changed
+            state_changed : threading.Event
+                Set when the pin input status changes after the event
+        """
 
         # Get board logger
         board_logger = self.get_board_logger()
 
         # Create new Event object to handle event communication
-        event = Event(datetime.now(), self.get_input_status())
+        event = Event(event_time, input_status, self.__email_retries)
         
-        event.alert(self.__ip, board_logger)
+        email = event.alert(self.__ip, board_logger)
 
-        if (self.get_input_status() == 1):
+        if (input_status == 1):
             
-            board_logger.info("Alarm state active; starting check alert " 
-                + "cycle for 6 cycles.")
+            board_logger.info(
+                "Alarm state active; starting check alert cycle for 6 cycles.")
             
-            self.check_alert(event)
+            self.check_alert(event, email, state_changed)
 
-    def check_alert(self, event):
+    def check_alert(self, event, email, state_changed):
         """If input pin signifies an alert, the program will keep alerting every
-        ten minutes for an hour."""
+        ten minutes for an hour or until the pin changes state.
+
+        Parameters
+        ----------
+            event : Event
+                Event object of the alarm
+            email : Email
+                Email prepared by the event's alert; Resent every cycle
+            state_changed : threading.Event
+                Set when the pin input status changes after the alarm
+        """
         
         # Get board logger
         board_logger = self.get_board_logger()
 
         # Loop for an hour and continue to alert every ten minutes 
-        current_time = datetime.now()
-        end_time = current_time + timedelta(0, 60)
-        # end_time = current_time + timedelta(hours=1)
+        deadline = monotonic() + 3600
 
         alarm_counter = 0
-        while current_time < end_time:
-            # Sleep for 10 minutes
-            sleep(10);
-            #sleep(600);
-
-            # Prevent race condition between Board input_status and check_alert 
-            if GPIO.input(self.__pin) == 1:
+        while True:
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                break
 
-                # Log alarm cycle
-                alarm_counter += 1
-                board_logger.info("Alarm Cycle #%s: Initiating event " 
-                    + "alert.", str(alarm_counter))
+            # Wait up to 10 minutes for monitor() to signal a pin change; 
+            # Returns at once if it changed before the cycle started
+            if state_changed.wait(min(600, remaining)):
+                # Pin changed state; the new status is alerted by its own 
+                # event so end this cycle
+                break
 
-                # Call Event object's alert method
-                event.alert(self.__ip, board_logger)
+            # Log alarm cycle
+            alarm_counter += 1
+            board_logger.info("Alarm Cycle #%s: Initiating event alert.", 
+                alarm_counter)
 
-                # Get current time
-                current_time = datetime.now()
-            
+            # Resend prepared alert or retry Event object's alert method
+            if email is None:
+                email = event.alert(self.__ip, board_logger)
             else:
-                # Input status is 0 indicating recovery; Break out of loop and 
-                # return to main thread       
-                board_logger.info("Alarm state recovery.")   
-                break
+                event.resend(email, board_logger)
+
+        if self.get_input_status() == 0:
+            # Input status is 0 indicating recovery; Return to main thread
+            board_logger.info("Alarm state recovery.")
         
         # End of alert cycle; Return to main thread
         status = "ALARM" if self.get_input_status() else "RECOVERY"
-        board_logger.info("End check alarm cycle. Current pin input "
-            + "status is %s.", status)
\ No newline at end of file
+        board_logger.info(
+            "End check alarm cycle. Current pin input status is %s.", status)
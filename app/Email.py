@@ -2,10 +2,12 @@
 
 # Standard library imports
 from email.mime.text import MIMEText
-from time import sleep
 import smtplib
 import ssl
 import sys
+import threading
+from time import monotonic
+from time import sleep
 
 # Local application imports
 try:
@@ -13,6 +15,172 @@ try:
 except ModuleNotFoundError:
     from mail_data import mail_data
 
+# Seconds a pooled SMTP connection may sit idle before it is closed
+IDLE_TIMEOUT = 90
+
+# Seconds an SMTP connect, NOOP, or send may block before it fails
+SMTP_TIMEOUT = 30
+
+# Seconds between NOOPs that keep a warmed up SMTP connection alive
+KEEPALIVE_INTERVAL = 60
+
+class _ConnectionPool:
+    """Pool of logged in SMTP connections shared by all Email objects.
+
+    Idle connections are keyed by server and sender and closed by a 
+    background thread once they have been idle for idle_timeout seconds. 
+    Keys registered with keep_warm() instead keep their most recently used 
+    connection open with a NOOP every keepalive_interval seconds.
+    """
+
+    def __init__(self, idle_timeout, keepalive_interval):
+        self.__idle_timeout = idle_timeout
+        self.__keepalive_interval = keepalive_interval
+        self.__idle = {}    # key: list of (smtp_server, last_used) pairs
+        self.__warm = {}    # key: function that opens a new connection
+        self.__lock = threading.Lock()
+        self.__maintainer = None
+
+    def acquire(self, key):
+        """Returns a live idle connection for key or None if there is none."""
+
+        while True:
+            with self.__lock:
+                idle = self.__idle.get(key)
+                if not idle:
+                    return None
+                smtp_server, last_used = idle.pop()
+
+            # Check connection has not been dropped by the server; Close a 
+            # dead one without QUIT, which would wait on it again
+            if self.__is_alive(smtp_server):
+                return smtp_server
+            smtp_server.close()
+
+    def release(self, key, smtp_server):
+        """Returns connection to the pool for reuse."""
+
+        with self.__lock:
+            self.__idle.setdefault(key, []).append((smtp_server, monotonic()))
+            self.__start_maintainer()
+
+    def keep_warm(self, key, connect):
+        """Opens a connection for key now and keeps one open from then on.
+
+        Parameters
+        ----------
+            key : tuple
+                Pool key of the connection
+            connect : function
+                Opens and logs in a new connection
+        """
+
+        # Start maintainer before connecting so it opens the connection later 
+        # if the network is not up yet
+        with self.__lock:
+            self.__warm[key] = connect
+            self.__start_maintainer()
+
+        smtp_server = self.acquire(key)
+        if smtp_server is None:
+            smtp_server = connect()
+        self.release(key, smtp_server)
+
+    def discard(self, smtp_server):
+        """Closes connection, ignoring errors from a dropped connection."""
+
+        try:
+            smtp_server.quit()
+        except Exception:
+            smtp_server.close()
+
+    def close_all(self):
+        """Closes all idle connections and stops keeping connections warm."""
+
+        with self.__lock:
+            idle = [smtp_server for connections in self.__idle.values() 
+                for smtp_server, last_used in connections]
+            self.__idle.clear()
+            self.__warm.clear()
+
+        for smtp_server in idle:
+            self.discard(smtp_server)
+
+    def __start_maintainer(self):
+        """Starts background thread to maintain idle connections once.
+
+        Precondition: Caller holds the pool lock.
+        """
+
+        if self.__maintainer is None:
+            self.__maintainer = threading.Thread(target=self.__maintain, 
+                name="SMTPMaintainer", daemon=True)
+            self.__maintainer.start()
+
+    def __is_alive(self, smtp_server):
+        """Returns whether connection responds to NOOP."""
+
+        try:
+            return smtp_server.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def __maintain(self):
+        """Closes connections that have been idle for idle_timeout seconds and
+        keeps connections of warm keys alive."""
+
+        while True:
+            sleep(self.__idle_timeout / 3)
+
+            expired = []
+            keepalive = []
+            with self.__lock:
+                now = monotonic()
+                for key, connections in self.__idle.items():
+                    # Hold back most recently used connection of a warm key
+                    warm = None
+                    if key in self.__warm and connections:
+                        warm = connections.pop()
+
+                    expired.extend(smtp_server for smtp_server, last_used 
+                        in connections if now - last_used >= self.__idle_timeout)
+                    connections[:] = [(smtp_server, last_used) for smtp_server, 
+                        last_used in connections 
+                        if now - last_used < self.__idle_timeout]
+
+                    if warm is not None:
+                        smtp_server, last_used = warm
+                        if now - last_used >= self.__keepalive_interval:
+                            keepalive.append((key, smtp_server))
+                        else:
+                            connections.append(warm)
+
+                # Warm keys without an idle connection need a new one
+                pinged = [key for key, smtp_server in keepalive]
+                missing = [key for key in self.__warm 
+                    if not self.__idle.get(key) and key not in pinged]
+                connect = dict(self.__warm)
+
+            for smtp_server in expired:
+                self.discard(smtp_server)
+
+            # NOOP warm connections; Replace any that have been dropped
+            for key, smtp_server in keepalive:
+                if self.__is_alive(smtp_server):
+                    self.release(key, smtp_server)
+                else:
+                    smtp_server.close()
+                    missing.append(key)
+
+            for key in missing:
+                try:
+                    self.release(key, connect[key]())
+                except Exception:
+                    # Network is unavailable; Try again on next pass
+                    pass
+
+_connection_pool = _ConnectionPool(IDLE_TIMEOUT, KEEPALIVE_INTERVAL)
+
 class Email:
     """Class that represents an email message.
 
@@ -34,10 +202,16 @@ class Email:
             Subject of email
         body : str
             Body of email
+        message : str
+            Email message rendered on first send
     Methods
     -------
         send_email()
             Sends an email based on self attributes
+        close_connections()
+            Closes idle pooled SMTP connections
+        warmup()
+            Opens a pooled SMTP connection ahead of the first email
     """
 
     def __init__(self, recipient, subject="", body=""):
@@ -69,11 +243,13 @@ class Email:
         self.__recipient = recipient
         self.__subject = subject
         self.__body = body
+        self.__message = None    # Set to None as send_email() will render
 
     def set_subject(self, subject):
         """Set subject attribute"""
 
         self.__subject = subject
+        self.__message = None
 
     def get_recipient(self):
         """Returns recipient property value"""
@@ -95,27 +271,67 @@ class Email:
     def send_email(self):
         """Sends email based on object attribute values"""
 
-        # Set up message details
-        message = MIMEText(self.__body, "plain")
-        message["Subject"] = self.__subject
-        message["From"] = self.__sender
-        message["To"] = self.__recipient
+        # Set up message details once and reuse them on later sends
+        if self.__message is None:
+            message = MIMEText(self.__body, "plain")
+            message["Subject"] = self.__subject
+            message["From"] = self.__sender
+            message["To"] = self.__recipient
+            self.__message = message.as_string()
 
         try:
-            # Create a secure connection and send email
-            with smtplib.SMTP_SSL(self.__imap, self.__port, 
-                context=self.__context) as smtp_server:
-                
-                # Login
-                smtp_server.login(self.__sender, self.__password)
-
-                # Send mail
+            # Reuse a pooled connection or create a secure connection
+            key = self.__pool_key()
+            smtp_server = _connection_pool.acquire(key)
+            if smtp_server is None:
+                smtp_server = self.__connect()
+
+            # Send mail and return connection to pool
+            try:
                 smtp_server.sendmail(self.__sender, self.__recipient, 
-                    message.as_string())
+                    self.__message)
+            except Exception:
+                _connection_pool.discard(smtp_server)
+                raise
+            _connection_pool.release(key, smtp_server)
 
         except Exception as error:
             raise Exception(error)
 
+    def __pool_key(self):
+        """Returns key of this email's SMTP connections in the pool"""
+
+        return (self.__imap, self.__port, self.__sender)
+
+    def __connect(self):
+        """Creates a secure connection to the SMTP server and logs in"""
+
+        smtp_server = smtplib.SMTP_SSL(self.__imap, self.__port, 
+            timeout=SMTP_TIMEOUT, context=self.__context)
+        
+        # Login
+        try:
+            smtp_server.login(self.__sender, self.__password)
+        except Exception:
+            smtp_server.close()
+            raise
+
+        return smtp_server
+
+    @staticmethod
+    def close_connections():
+        """Closes idle pooled SMTP connections"""
+
+        _connection_pool.close_all()
+
+    @classmethod
+    def warmup(cls):
+        """Opens a pooled SMTP connection ahead of the first email and keeps it
+        alive so that alerts are sent without connecting and logging in"""
+
+        email = cls(mail_data["it_email"])
+        _connection_pool.keep_warm(email.__pool_key(), email.__connect)
+
 if __name__ == "__main__":
     """Test email functionality"""
 
@@ -4,6 +4,7 @@ GPIO pin.
 
 # Standard library imports
 import datetime
+import random
 from time import sleep
 
 # Local application imports
@@ -11,6 +12,29 @@ from app.Email import Email
 from app.FreezerData import FreezerData
 from app.mail_data import mail_data
 
+# Attempts to email IT team before giving up; About a day at the 5 minute 
+# backoff cap
+MAX_EMAIL_ATTEMPTS = 288
+
+# Email subject and body templates for each event status
+_ALARM_SUBJECT = (
+    "!!! -80 ALARM !!! Problem detected on {date} at {time} in {location}"
+)
+_ALARM_BODY = (
+    "ALARM event detected on {date} at {time}. "
+    "\nThere is a problem with the -80 in {location}."
+)
+_RECOVERY_SUBJECT = (
+    "!!! -80 RECOVERY !!! Recovery detected on {date} at {time} in {location}"
+)
+_RECOVERY_BODY = (
+    "RECOVERY event detected on {date} at {time} for minus 80 in {location}."
+)
+_TEMPLATES = {
+    "ALARM": (_ALARM_SUBJECT, _ALARM_BODY),
+    "RECOVERY": (_RECOVERY_SUBJECT, _RECOVERY_BODY)
+}
+
 class Event:
     """Class to represent an Event that gets trigger when a change is detected on a
     GPIO pin.
@@ -21,19 +45,26 @@ class Event:
             Time of event
         status : str
             Type of event that has occured, either ALARM or RECOVERY
+        freezer_data : FreezerData
+            Freezer data parsed by the first successful alert
+        email_retries : queue.SimpleQueue
+            Queue of failed IT team emails for a retry worker, None to retry 
+            in place
     Methods
     -------
         alert(ip, board_logger)
             Alerts the appropriate parties that an event has happened
+        resend(email, board_logger)
+            Resends a prepared alert email to notify event status again
         handle_error(error, error_message, board_logger)
             Logs error and then attempts to email IT Team error message
         notify_recipients(freezer_data, success_message, board_logger)
             Sends email to appropriate recipients to notify event status
-        handle_email_error(email, board_logger)
-            Tries to send email every 5 minutes
+        handle_email_error(email, board_logger, stopped)
+            Tries to send email with exponential backoff up to every 5 minutes
     """
 
-    def __init__(self, event_time, event_type):
+    def __init__(self, event_time, event_type, email_retries=None):
         """
         Parameters
         ----------
@@ -41,10 +72,15 @@ class Event:
                 Time of event
             status : str
                 Type of event that has occured, either ALARM or RECOVERY
+            email_retries : queue.SimpleQueue
+                Queue of failed IT team emails for a retry worker, None to 
+                retry in place
         """
         
         self.__event_time = event_time
         self.__status = "ALARM" if event_type else "RECOVERY"
+        self.__freezer_data = None    # Set to None as alert() will initialize
+        self.__email_retries = email_retries
     
     def get_event_time(self):
         """Returns event time"""
@@ -73,30 +109,52 @@ class Event:
 
         Returns
         -------
-            self.alerted : bool
-                Whether event was successfully alerted
+            email : Email
+                Email prepared for recipients or None if CSV failed to parse
         """
         
-        # Create new FreezerData object
-        freezer_data = FreezerData()
-        
-        # Parse CSV file
-        try:
-            freezer_data.parse_csv(ip)
-            if (freezer_data.get_data() == {}):
-                raise Exception("CSV data returned empty.")
-            else:
-                parsed = True
-        except Exception as error:
-            # Error has been caught; log the error and email IT team
-            parsed = False
-            error_message = "Failed to parse CSV file"
-            self.handle_error(error, error_message, board_logger)
+        # Reuse freezer data parsed by an earlier alert of this event
+        if self.__freezer_data is not None:
+            freezer_data = self.__freezer_data
+            parsed = True
+        else:
+            # Create new FreezerData object
+            freezer_data = FreezerData()
+            
+            # Parse CSV file
+            try:
+                freezer_data.parse_csv(ip)
+                if (freezer_data.get_data() is None):
+                    raise Exception("CSV data returned empty.")
+                else:
+                    parsed = True
+                    self.__freezer_data = freezer_data
+            except Exception as error:
+                # Error has been caught; log the error and email IT team
+                parsed = False
+                error_message = "Failed to parse CSV file"
+                self.handle_error(error, error_message, board_logger)
 
         # Notify recipients of minus 80 status
         if (parsed):
             success_message = "Parsed CSV file for freezer data"
-            self.notify_recipients(freezer_data, success_message, board_logger)
+            return self.notify_recipients(freezer_data, success_message, 
+                board_logger)
+
+        return None
+
+    def resend(self, email, board_logger):
+        """Resends a prepared alert email to notify event status again.
+
+        Parameters
+        ----------
+            email : Email
+                Email object returned by alert
+            board_logger: Logger
+                Logger object to log to console
+        """
+
+        self.__send(email, board_logger)
 
     def notify_recipients(self, freezer_data, success_message, board_logger):
         """Sends email to appropriate recipients to notify event status.
@@ -111,44 +169,36 @@ class Event:
                 Message that indicates success
             board_logger: Logger
                 Logger object to log to console
+
+        Returns
+        -------
+            email : Email
+                Email object sent to recipients
         """
 
         board_logger.info("%s.", success_message)
         data = freezer_data.get_data()
 
-        # Create string to represent event data
-        date = self.get_event_time().strftime('%m/%d/%Y')
-        time = self.get_event_time().strftime('%H:%M:%S')
-        location = data['Location']
+        # Create string to represent event data with a single strftime call
+        date, time = self.get_event_time().strftime('%m/%d/%Y %H:%M:%S').split()
+        fields = {"date": date, "time": time, "location": data.location}
 
         # Email details
-        if (self.get_event_status() == "ALARM"):
-            subject = (
-                f"!!! -80 ALARM !!! Problem detected on " 
-                f"{date} at {time} in {location}"
-            )
-            
-            body = (
-                f"ALARM event detected on "
-                f"{date} at {time}. "
-                f"\nThere is a problem with the -80 in {location}."
-            )
-        else:
-            subject = (
-                f"!!! -80 RECOVERY !!! Recovery detected on " 
-                f"{date} at {time} in {location}"
-            )
-
-            body = (
-                f"RECOVERY event detected on "
-                f"{date} at {time} for minus 80 in "
-                f"{location}."
-            )
-        recipient = data["Email"]
+        subject, body = _TEMPLATES[self.get_event_status()]
+        subject = subject.format_map(fields)
+        body = body.format_map(fields)
+        recipient = data.email
 
         # Create Email object and try to send mail
+        email = Email(recipient, subject, body)
+        self.__send(email, board_logger)
+
+        return email
+
+    def __send(self, email, board_logger):
+        """Sends email to recipients and handles failure to send."""
+
         try:
-            email = Email(recipient, subject, body)
             email.send_email()
             board_logger.info("Email sent to %s.", email.get_recipient())
         except Exception as error:
@@ -195,16 +245,23 @@ class Event:
                        
             # Failed to email, log the error
             board_logger.critical("ERROR: %s.", error_message)
-            board_logger.critical("Attempting to email IT team every 5 " +
-                "minutes until successful.")
+            board_logger.critical("Attempting to email IT team with backoff "
+                "of up to 5 minutes for up to %i attempts.", MAX_EMAIL_ATTEMPTS)
             board_logger.critical("DETAILS: %s", error)
             
-            # Try to email every 5 minutes
+            # Try to email with backoff of up to 5 minutes; Hand off to the 
+            # retry worker so later events are still alerted
             email.set_subject(error_message)
-            self.handle_email_error(email, board_logger)
+            if self.__email_retries is None:
+                self.handle_email_error(email, board_logger)
+            else:
+                self.__email_retries.put((self, email))
+
+    def handle_email_error(self, email, board_logger, stopped=None):
+        """Tries to send email with exponential backoff up to every 5 minutes.
 
-    def handle_email_error(self, email, board_logger):
-        """Tries to send email every 5 minutes.
+        Gives up after MAX_EMAIL_ATTEMPTS failures or once stopped is set. 
+        Failures are logged on attempts 1, 2, 4, 8... and on the last attempt.
 
         Precondition: Failed to send email to FreezerData recipients and to IT 
         team.
@@ -215,23 +272,45 @@ class Event:
                 Email object
             board_logger: Logger
                 Logger object to log to console
+            stopped : threading.Event
+                Set to stop retrying; None to retry until sent or the cap
+
+        Returns
+        -------
+            email_sent : bool
+                Whether email was sent before giving up
         """
 
         # Flag to track if email is sent
         email_sent = False
         failure_count = 0
         
-        while not email_sent:
-            # Sleep for 5 minutes
-            sleep(5)
+        while not email_sent and failure_count < MAX_EMAIL_ATTEMPTS:
+            # Sleep for 5 seconds doubling up to 5 minutes, with 10% jitter
+            delay = min(300, 5 * 2 ** min(failure_count, 6))
+            delay += random.uniform(0, delay * 0.1)
+            if stopped is None:
+                sleep(delay)
+            elif stopped.wait(delay):
+                break
             try:
                 email.send_email()
                 board_logger.info("Email sent to %s.", email.get_recipient())
                 email_sent = True
             except Exception as error:
                 failure_count += 1
-                board_logger.critical("Failure attempt #%i", failure_count)
-                board_logger.critical("Failure to send email to %s.", 
-                    email.get_recipient())
-                board_logger.critical("ERROR DETAILS: %s", error)
-                email_sent = False
\ No newline at end of file
+                email_sent = False
+
+                # Log powers of two attempts and the last attempt
+                if (failure_count & (failure_count - 1) == 0 
+                    or failure_count == MAX_EMAIL_ATTEMPTS):
+                    board_logger.critical("Failure attempt #%i", failure_count)
+                    board_logger.critical("Failure to send email to %s.", 
+                        email.get_recipient())
+                    board_logger.critical("ERROR DETAILS: %s", error)
+
+        if not email_sent:
+            board_logger.critical("Giving up on email to %s after %i attempts.", 
+                email.get_recipient(), failure_count)
+
+        return email_sent
\ No newline at end of file
@@ -1,9 +1,51 @@
 """Class module that represents freezer data obtained from CSV file."""
 
 # Standard library imports
+from collections import namedtuple
 import csv
+import functools
+import os
 import pathlib
 
+# Freezer data used to alert about an event
+FreezerRow = namedtuple("FreezerRow", "location email")
+
+def _load_table(csv_file):
+    """Returns freezer data from CSV file as a dictionary of FreezerRow keyed 
+    by IP.
+
+    The table is reparsed only when the file's modification time changes.
+
+    Parameters:
+        csv_file : str
+            File path location of file that contains freezer data
+    """
+
+    return _parse_table(csv_file, os.stat(csv_file).st_mtime_ns)
+
+@functools.lru_cache(maxsize=1)
+def _parse_table(csv_file, mtime):
+    """Parses CSV file into a dictionary of FreezerRow keyed by IP. The first 
+    row for an IP is used, matching a top to bottom search of the file."""
+
+    with open(csv_file, newline='') as file:
+        reader = csv.reader(file)
+
+        # Find columns of the fields used from the header
+        header = next(reader)
+        ip_index = header.index("IP")
+        location_index = header.index("Location")
+        email_index = header.index("Email")
+        last_index = max(ip_index, location_index, email_index)
+
+        # Keep first row for an IP that is listed more than once
+        table = {}
+        for row in reader:
+            if len(row) > last_index:
+                table.setdefault(row[ip_index], 
+                    FreezerRow(row[location_index], row[email_index]))
+        return table
+
 class FreezerData:
     """
     Class that represents freezer data obtained from CSV file.
@@ -12,8 +54,8 @@ class FreezerData:
     ----------
         csv_file : Path
             File path location of file that contains freezer data
-        data : dictionary
-            Dictionary of freezer data
+        data : FreezerRow
+            Location and email of freezer, None if not found
     Methods
     -------
         parse_csv(ip): Parse CSV file and determines appropriate freezer data
@@ -22,17 +64,17 @@ class FreezerData:
     def __init__(self, csv_file = pathlib.Path("/home/pi/minus80/app/freezer_info.csv")):
 
         self.__csv_file = csv_file
-        self.__data = {}
+        self.__data = None
     
     def get_data(self):
         """ Returns Freezer Data data attribute"""
         
         return self.__data
     
-    def set_data(self, ordered_dict):
+    def set_data(self, data):
         """ Sets Freezer Data dat attribute"""
         
-        self.__data = ordered_dict
+        self.__data = data
     
     def parse_csv(self, ip):
         """Parses CSV file and populates data attribute with appropriate freezer 
@@ -43,13 +85,5 @@ class FreezerData:
                 IP of the Raspberry Pi
         """
 
-        # Open CSV file and read in data as a dictionary
-        try:
-            with open(self.__csv_file, newline='') as csv_file:
-                reader = csv.DictReader(csv_file)
-                for row in reader:
-                    if row["IP"] == ip:
-                        self.__data = row
-                        break
-        except FileNotFoundError:
-            raise
\ No newline at end of file
+        # Look up row in cached CSV data
+        self.__data = _load_table(str(self.__csv_file)).get(ip)
\ No newline at end of file
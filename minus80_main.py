@@ -3,12 +3,28 @@
 Functions
 ---------
     monitor(): Creates Board object to watch the state of an input pin.
+    warmup_email(board_logger): Opens an SMTP connection ahead of the first 
+        alert.
 """
 
+# Standard library imports
+from threading import Thread
+
 # Local application imports
 from app.Board import Board
+from app.Email import Email
+
+# BCM GPIO17: physical pin 11 of the Raspberry Pi header
+PIN = 17
 
-PIN = 11
+def warmup_email(board_logger):
+    """Connects to the SMTP server so the first alert is sent on an open 
+    connection."""
+
+    try:
+        Email.warmup()
+    except Exception as error:
+        board_logger.warning("Failed to warm up SMTP connection: %s", error)
 
 def monitor():
     """Creates a Board object to monitor the state of an input pin."""
@@ -23,6 +39,12 @@ def monitor():
     # Setup board: Mode and input pin
     board.setup()
 
+    # Connect to SMTP server in the background so monitoring starts at once 
+    # even when the network is not up yet
+    warmup_thread = Thread(target=warmup_email, 
+        args=(board.get_board_logger(),), name="SMTPWarmup", daemon=True)
+    warmup_thread.start()
+
     # Monitor board for events
     board.monitor()
 
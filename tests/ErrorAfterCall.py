@@ -5,7 +5,7 @@ class ErrorAfterCall(object):
         self.limit = limit
         self.calls = 0
     
-    def __call__(self):
+    def __call__(self, *args, **kwargs):
         self.calls += 1
         if self.calls > self.limit:
             raise CallableExhausted
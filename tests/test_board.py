@@ -0,0 +1,268 @@
+# Standard library imports
+from datetime import datetime
+import logging
+import os
+import signal
+import sys
+import threading
+import unittest
+from unittest.mock import Mock
+from unittest.mock import patch, call
+
+# Third part imports
+from gpiod.edge_event import EdgeEvent
+from gpiod.line import Value
+
+# Local application imports
+from app.Board import Board
+from app.Board import _BoardFormatter
+from app.Event import Event
+from app.FreezerData import FreezerRow
+from app.mail_data import mail_data
+from tests.ErrorAfterCall import ErrorAfterCall, CallableExhausted
+
+class FakeLineRequest:
+    """Line request for an inactive pin that reports a rising edge for each 
+    byte written to a pipe"""
+
+    def __init__(self):
+        self.fd, self.__edge_fd = os.pipe()
+        self.released = False
+
+    def rise(self):
+        """Reports a rising edge on the pin"""
+
+        os.write(self.__edge_fd, b"\0")
+
+    def get_value(self, offset):
+        return Value.INACTIVE
+
+    def read_edge_events(self):
+        os.read(self.fd, 1)
+        return [Mock(event_type=EdgeEvent.Type.RISING_EDGE)]
+
+    def release(self):
+        self.released = True
+        os.close(self.fd)
+        os.close(self.__edge_fd)
+
+class TestBoard(unittest.TestCase):
+    """Test methods from Board Class"""
+
+    @patch("app.Board.SysLogHandler", 
+        side_effect=lambda address: logging.NullHandler())
+    def setUp(self, mock_syslog_handler):
+        # Create Board object in alarm state
+        self.board = Board(17)
+        self.board.set_input_status(1)
+        self.addCleanup(self.board.shutdown)
+
+    def test_check_alert(self):
+        """Tests Board resends alert each alarm cycle while in alarm state"""
+
+        event = Mock()
+        email = Mock()
+
+        # Time out waiting for a pin change until wait is exhausted
+        state_changed = Mock(wait=ErrorAfterCall(3))
+        with self.assertRaises(CallableExhausted):
+            self.board.check_alert(event, email, state_changed)
+
+        # Assert alert was resent after each cycle
+        event.resend.assert_has_calls([call(email, 
+            self.board.get_board_logger())] * 3)
+        event.alert.assert_not_called()
+
+    def test_check_alert_recovery(self):
+        """Tests Board ends alarm cycle when pin changes to recovery"""
+
+        event = Mock()
+        email = Mock()
+
+        # Pin changes to recovery while waiting
+        def recover(timeout):
+            self.board.set_input_status(0)
+            return True
+
+        state_changed = Mock()
+        state_changed.wait.side_effect = recover
+        self.board.check_alert(event, email, state_changed)
+
+        # Assert alert was not resent
+        event.resend.assert_not_called()
+        event.alert.assert_not_called()
+
+    @patch("smtplib.SMTP_SSL", side_effect=OSError("Network is unreachable"))
+    @patch("app.Event.FreezerData")
+    def test_email_retries_merged(self, mock_freezer_data, mock_smtp_ssl):
+        """Tests failed emails of an alarm and its resends are retried once on 
+        the retry thread"""
+
+        # Freezer data found for IP; Every email fails to send
+        mock_freezer_data.return_value.get_data.return_value = FreezerRow(
+            'LGRT 3', 'minus80-Person3@chem.umass.edu')
+
+        # Hold retry until shutdown
+        retrying = threading.Event()
+        def retry(email, board_logger, stopped):
+            retrying.set()
+            stopped.wait(5)
+            return False
+
+        board_logger = self.board.get_board_logger()
+        with patch.object(Event, "handle_email_error", 
+            side_effect=retry) as mock_retry, \
+            patch.object(board_logger, "critical") as mock_critical:
+
+            # Alert and resend twice before pin changes
+            state_changed = Mock()
+            state_changed.wait.side_effect = [False, False, True]
+            self.board.alert(1, datetime.now(), state_changed)
+            self.assertTrue(retrying.wait(5))
+
+            # Assert one retry thread is running
+            retry_threads = [thread for thread in threading.enumerate() 
+                if thread.name == "EmailRetryThread"]
+            self.assertEqual(len(retry_threads), 1)
+
+            self.board.shutdown()
+
+        # Assert three failures, each emailing recipient and IT team, were 
+        # merged into a single IT team email retry with none left to drop
+        self.assertEqual(mock_smtp_ssl.call_count, 6)
+        mock_retry.assert_called_once()
+        self.assertNotIn(call("Shutting down; dropping email to %s.", 
+            mail_data["it_email"]), mock_critical.call_args_list)
+        email = mock_retry.call_args[0][0]
+        self.assertEqual(email.get_recipient(), mail_data["it_email"])
+        self.assertFalse(retry_threads[0].is_alive())
+
+    def test_consume(self):
+        """Tests Board alerts queued events in order until shutdown"""
+
+        # Queue an alarm then a recovery
+        with patch.object(self.board, "alert") as mock_alert:
+            self.board.initiate_event()
+            self.board.set_input_status(0)
+            self.board.initiate_event()
+            self.board.shutdown()
+
+        # Assert both events were alerted in order and event thread stopped
+        statuses = [args[0] for args, kwargs in mock_alert.call_args_list]
+        self.assertEqual(statuses, [1, 0])
+        self.assertNotIn("EventThread", 
+            [thread.name for thread in threading.enumerate()])
+
+    def test_consume_alert_failed(self):
+        """Tests Board logs a failed alert and alerts the next event"""
+
+        # First alert fails
+        error = Exception("CSV data returned empty.")
+        board_logger = self.board.get_board_logger()
+        with patch.object(self.board, "alert", 
+            side_effect=[error, None]) as mock_alert, \
+            patch.object(board_logger, "error") as mock_error:
+            self.board.initiate_event()
+            self.board.initiate_event()
+            self.board.shutdown()
+
+        # Assert failure was logged and the next event still alerted
+        mock_error.assert_called_once_with("Event alert failed: %s", error)
+        self.assertEqual(mock_alert.call_count, 2)
+
+    @patch("app.Board.SHUTDOWN_TIMEOUT", 0.1)
+    def test_shutdown_timeout(self):
+        """Tests Board shutdown stops waiting on an alert after the timeout"""
+
+        # Alert that does not finish until released
+        release = threading.Event()
+        self.addCleanup(release.set)
+        board_logger = self.board.get_board_logger()
+        with patch.object(self.board, "alert", 
+            side_effect=lambda *args: release.wait(5)), \
+            patch.object(board_logger, "warning") as mock_warning:
+            self.board.initiate_event()
+            self.board.shutdown()
+
+        # Assert shutdown gave up waiting and logged it
+        mock_warning.assert_called_once_with("Event thread still alerting "
+            "after %s seconds; Queued events may not be alerted.", 0.1)
+
+        # Let alert finish so event thread stops
+        release.set()
+        for thread in threading.enumerate():
+            if thread.name == "EventThread":
+                thread.join(5)
+
+    @patch("app.Board.gpiod.request_lines")
+    def test_monitor_sigterm(self, mock_request_lines):
+        """Tests Board alerts a pin change and ends monitor on SIGTERM"""
+
+        # Set up board on a fake pin
+        line_request = FakeLineRequest()
+        mock_request_lines.return_value = line_request
+        self.board.setup()
+
+        # SIGTERM handler to be restored; Ignores a SIGTERM sent after monitor
+        def sigterm_handler(signum, frame):
+            pass
+        previous_handler = signal.signal(signal.SIGTERM, sigterm_handler)
+        self.addCleanup(signal.signal, signal.SIGTERM, previous_handler)
+
+        # Raise pin, then send SIGTERM to a thread other than the main thread
+        # once the alarm is alerted
+        alerted = threading.Event()
+        def stop():
+            line_request.rise()
+            alerted.wait(5)
+            signal.pthread_kill(threading.get_ident(), signal.SIGTERM)
+        stop_thread = threading.Thread(target=stop)
+
+        with patch.object(self.board, "alert", 
+            side_effect=lambda *args: alerted.set()) as mock_alert:
+            stop_thread.start()
+            self.board.monitor()
+        stop_thread.join()
+
+        # Assert alarm was alerted, signal handling restored and pin released
+        mock_alert.assert_called_once()
+        self.assertEqual(mock_alert.call_args[0][0], 1)
+        self.assertIs(signal.getsignal(signal.SIGTERM), sigterm_handler)
+        self.assertEqual(signal.set_wakeup_fd(-1), -1)
+        self.assertTrue(line_request.released)
+
+    def test_board_formatter(self):
+        """Tests board log lines match the original log format"""
+
+        # Original format with the board date format
+        board_format = logging.Formatter("%(asctime)s - %(threadName)s - "
+            "%(module)s - %(levelname)s : %(message)s", 
+            datefmt="%Y-%m-%d %H:%M:%S")
+        formatter = _BoardFormatter()
+        def make_record(created, **fields):
+            record = logging.makeLogRecord(dict(name="app.Board", 
+                levelno=logging.INFO, levelname="INFO", module="Board", 
+                threadName="EventThread", msg="Email sent to %s.", 
+                args=("it@test.edu",), **fields))
+            record.created = created
+            return record
+
+        # Assert lines match for records in the same and the next second
+        for created in (1700000000.25, 1700000000.75, 1700000001.5):
+            record = make_record(created)
+            self.assertEqual(formatter.format(record), 
+                board_format.format(record))
+
+        # Assert exception text is appended to the line
+        try:
+            raise Exception("CSV data returned empty.")
+        except Exception:
+            record = make_record(1700000002.0, exc_info=sys.exc_info())
+        line = formatter.format(record)
+        self.assertEqual(line, board_format.format(record))
+        self.assertTrue(line.split(" - ", 1)[1].startswith("EventThread - "
+            "Board - INFO : Email sent to it@test.edu.\nTraceback"))
+        self.assertTrue(line.endswith("Exception: CSV data returned empty."))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,9 @@
 # Standard library imports
 from email.mime.text import MIMEText
 import smtplib
+import socket
+from time import monotonic
+from time import sleep
 import unittest
 from unittest import mock
 from unittest.mock import Mock
@@ -8,10 +11,16 @@ from unittest.mock import patch, call
 
 # Local application imports
 from app.Email import Email
+from app.Email import _ConnectionPool
+from app.Email import SMTP_TIMEOUT
 
 class TestEmail(unittest.TestCase):
     """ Test methods from Email Class"""
 
+    def setUp(self):
+        # Start each test with an empty connection pool
+        Email.close_connections()
+
     @mock.patch.dict('app.mail_data.mail_data', {'it_email': 'it@test.edu', \
         'sender': 'sender@test.edu', 'mail_password': 'test123', 
         'imap_server': 'smtp.test.edu', 'port': 465} )
@@ -57,8 +66,8 @@ class TestEmail(unittest.TestCase):
         # Send an email
         email.send_email()
 
-        # Object returned from smtp context manager
-        mock_smtp_cm = mock_smtp_ssl.return_value.__enter__.return_value
+        # Object returned from smtp constructor
+        mock_smtp_cm = mock_smtp_ssl.return_value
 
         # Assert login was called once
         mock_smtp_cm.login.assert_called_once_with('sender@test.edu', 'test123')
@@ -67,6 +76,128 @@ class TestEmail(unittest.TestCase):
         mock_smtp_cm.sendmail.assert_called_once_with('sender@test.edu', \
             recipient, message.as_string())
 
+    @patch("smtplib.SMTP_SSL")
+    @mock.patch.dict('app.mail_data.mail_data', {'it_email': 'it@test.edu', \
+        'sender': 'sender@test.edu', 
+        'mail_password': 'test123', 'imap_server': 'smtp.test.edu', 'port': 465} )
+    def test_send_mail_reuses_connection(self, mock_smtp_ssl):
+        """Tests Email objects reuse a pooled SMTP connection"""
+
+        # Pooled connection responds to NOOP
+        mock_smtp = mock_smtp_ssl.return_value
+        mock_smtp.noop.return_value = (250, b'OK')
+
+        # Send two emails
+        Email('recipient1@test.edu', 'subject 1', 'body 1').send_email()
+        Email('recipient2@test.edu', 'subject 2', 'body 2').send_email()
+
+        # Assert connection was created and logged in once
+        mock_smtp_ssl.assert_called_once()
+        mock_smtp.login.assert_called_once_with('sender@test.edu', 'test123')
+        mock_smtp.noop.assert_called_once()
+        self.assertEqual(mock_smtp.sendmail.call_count, 2)
+
+    @patch("smtplib.SMTP_SSL")
+    @mock.patch.dict('app.mail_data.mail_data', {'it_email': 'it@test.edu', \
+        'sender': 'sender@test.edu', 
+        'mail_password': 'test123', 'imap_server': 'smtp.test.edu', 'port': 465} )
+    def test_send_mail_reconnects_dropped_connection(self, mock_smtp_ssl):
+        """Tests Email object reconnects when pooled connection was dropped"""
+
+        # Pooled connection has been closed by the server
+        mock_smtp = mock_smtp_ssl.return_value
+        mock_smtp.noop.side_effect = smtplib.SMTPServerDisconnected()
+
+        # Send two emails
+        Email('recipient1@test.edu', 'subject 1', 'body 1').send_email()
+        Email('recipient2@test.edu', 'subject 2', 'body 2').send_email()
+
+        # Assert a new connection was created and logged in for second email
+        self.assertEqual(mock_smtp_ssl.call_count, 2)
+        self.assertEqual(mock_smtp.login.call_count, 2)
+        self.assertEqual(mock_smtp.sendmail.call_count, 2)
+
+    @patch("smtplib.SMTP_SSL")
+    @mock.patch.dict('app.mail_data.mail_data', {'it_email': 'it@test.edu', \
+        'sender': 'sender@test.edu', 
+        'mail_password': 'test123', 'imap_server': 'smtp.test.edu', 'port': 465} )
+    def test_send_mail_reconnects_timed_out_connection(self, mock_smtp_ssl):
+        """Tests Email object reconnects when pooled connection times out"""
+
+        # Pooled connection is half open and NOOP times out
+        mock_smtp = mock_smtp_ssl.return_value
+        mock_smtp.noop.side_effect = socket.timeout("timed out")
+
+        # Send two emails
+        Email('recipient1@test.edu', 'subject 1', 'body 1').send_email()
+        Email('recipient2@test.edu', 'subject 2', 'body 2').send_email()
+
+        # Assert connections are opened with a timeout
+        mock_smtp_ssl.assert_called_with('smtp.test.edu', 465, 
+            timeout=SMTP_TIMEOUT, context=mock.ANY)
+
+        # Assert timed out connection was closed and replaced
+        mock_smtp.close.assert_called_once()
+        self.assertEqual(mock_smtp_ssl.call_count, 2)
+        self.assertEqual(mock_smtp.sendmail.call_count, 2)
+
+    @patch("smtplib.SMTP_SSL")
+    @mock.patch.dict('app.mail_data.mail_data', {'it_email': 'it@test.edu', \
+        'sender': 'sender@test.edu', 
+        'mail_password': 'test123', 'imap_server': 'smtp.test.edu', 'port': 465} )
+    def test_warmup(self, mock_smtp_ssl):
+        """Tests Email object sends on connection opened by warmup"""
+
+        # Warmed up connection responds to NOOP
+        mock_smtp = mock_smtp_ssl.return_value
+        mock_smtp.noop.return_value = (250, b'OK')
+
+        # Warm up connection
+        Email.warmup()
+        mock_smtp_ssl.assert_called_once()
+        mock_smtp.login.assert_called_once_with('sender@test.edu', 'test123')
+
+        # Send an email
+        Email('recipient@test.edu', 'subject', 'body').send_email()
+
+        # Assert email was sent without a new connection
+        mock_smtp_ssl.assert_called_once()
+        mock_smtp.login.assert_called_once()
+        mock_smtp.sendmail.assert_called_once()
+
+    @patch("smtplib.SMTP_SSL")
+    @mock.patch.dict('app.mail_data.mail_data', {'it_email': 'it@test.edu', \
+        'sender': 'sender@test.edu', 
+        'mail_password': 'test123', 'imap_server': 'smtp.test.edu', 'port': 465} )
+    def test_warmup_failed(self, mock_smtp_ssl):
+        """Tests connection is warmed up by the maintainer after warmup fails"""
+
+        # Pool maintained every 0.1 seconds; Network is down for first connect
+        connection_pool = _ConnectionPool(0.3, 0.1)
+        self.addCleanup(connection_pool.close_all)
+        mock_smtp = Mock()
+        mock_smtp.noop.return_value = (250, b'OK')
+        mock_smtp_ssl.side_effect = [OSError("Network is unreachable"), 
+            mock_smtp]
+
+        with patch("app.Email._connection_pool", connection_pool):
+            # Warm up connection while network is down
+            with self.assertRaises(OSError):
+                Email.warmup()
+
+            # Wait for a maintainer pass to connect
+            deadline = monotonic() + 5
+            while mock_smtp_ssl.call_count < 2 and monotonic() < deadline:
+                sleep(0.05)
+            mock_smtp.login.assert_called_once_with('sender@test.edu', 
+                'test123')
+
+            # Send an email
+            Email('recipient@test.edu', 'subject', 'body').send_email()
+
+        # Assert email was sent on connection opened by the maintainer
+        self.assertEqual(mock_smtp_ssl.call_count, 2)
+        mock_smtp.sendmail.assert_called_once()
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
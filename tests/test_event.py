@@ -0,0 +1,122 @@
+# Standard library imports
+import datetime
+import threading
+import unittest
+from unittest.mock import Mock
+from unittest.mock import patch, call
+
+# Local application imports
+from app.Event import Event
+from app.FreezerData import FreezerRow
+from tests.ErrorAfterCall import ErrorAfterCall, CallableExhausted
+
+class TestEvent(unittest.TestCase):
+    """Test methods from Event Class"""
+
+    @patch("app.Event.sleep", new_callable=lambda: ErrorAfterCall(3))
+    def test_handle_email_error(self, mock_sleep):
+        """Tests Event retries email and logs failure attempts with backoff"""
+
+        # Email that always fails to send
+        email = Mock()
+        email.send_email.side_effect = Exception("SMTP server unavailable")
+        board_logger = Mock()
+
+        # Try to send email until sleep is exhausted
+        event = Event(datetime.datetime.now(), 1)
+        with self.assertRaises(CallableExhausted):
+            event.handle_email_error(email, board_logger)
+
+        # Assert an attempt was made after each sleep
+        self.assertEqual(email.send_email.call_count, 3)
+
+        # Assert only power of two failure attempts were logged
+        logged = board_logger.critical.call_args_list
+        self.assertIn(call("Failure attempt #%i", 1), logged)
+        self.assertIn(call("Failure attempt #%i", 2), logged)
+        self.assertNotIn(call("Failure attempt #%i", 3), logged)
+
+    @patch("app.Event.sleep", new_callable=lambda: ErrorAfterCall(3))
+    def test_handle_email_error_sent(self, mock_sleep):
+        """Tests Event stops retrying email once it is sent"""
+
+        # Email that fails to send once
+        email = Mock()
+        email.send_email.side_effect = [Exception("SMTP server unavailable"), 
+            None]
+        email.get_recipient.return_value = "it@test.edu"
+        board_logger = Mock()
+
+        # Try to send email
+        event = Event(datetime.datetime.now(), 1)
+        event.handle_email_error(email, board_logger)
+
+        # Assert email was sent on second attempt
+        self.assertEqual(mock_sleep.calls, 2)
+        board_logger.info.assert_called_once_with("Email sent to %s.", 
+            "it@test.edu")
+
+    @patch("app.Event.MAX_EMAIL_ATTEMPTS", 5)
+    @patch("app.Event.sleep")
+    def test_handle_email_error_gives_up(self, mock_sleep):
+        """Tests Event stops retrying email after the attempt cap"""
+
+        # Email that always fails to send
+        email = Mock()
+        email.send_email.side_effect = Exception("SMTP server unavailable")
+        email.get_recipient.return_value = "it@test.edu"
+        board_logger = Mock()
+
+        # Try to send email
+        event = Event(datetime.datetime.now(), 1)
+        email_sent = event.handle_email_error(email, board_logger)
+
+        # Assert loop stopped at the cap and logged giving up
+        self.assertFalse(email_sent)
+        self.assertEqual(email.send_email.call_count, 5)
+        logged = board_logger.critical.call_args_list
+        self.assertIn(call("Failure attempt #%i", 5), logged)
+        board_logger.critical.assert_called_with(
+            "Giving up on email to %s after %i attempts.", "it@test.edu", 5)
+
+    def test_handle_email_error_stopped(self):
+        """Tests Event stops retrying email once stopped is set"""
+
+        # Email that always fails to send; Retry is stopped
+        email = Mock()
+        email.send_email.side_effect = Exception("SMTP server unavailable")
+        board_logger = Mock()
+        stopped = threading.Event()
+        stopped.set()
+
+        # Try to send email
+        event = Event(datetime.datetime.now(), 1)
+        email_sent = event.handle_email_error(email, board_logger, stopped)
+
+        # Assert no attempt was made after stop
+        self.assertFalse(email_sent)
+        email.send_email.assert_not_called()
+
+    @patch("app.Event.Email")
+    @patch("app.Event.FreezerData")
+    def test_alert_reuses_freezer_data(self, mock_freezer_data, mock_email):
+        """Tests Event parses freezer data once across repeated alerts"""
+
+        # Freezer data found for IP
+        mock_freezer_data.return_value.get_data.return_value = FreezerRow(
+            'LGRT 3', 'minus80-Person3@chem.umass.edu')
+        board_logger = Mock()
+
+        # Alert twice for the same event
+        event = Event(datetime.datetime.now(), 1)
+        event.alert("92.168.1.100", board_logger)
+        event.alert("92.168.1.100", board_logger)
+
+        # Assert CSV was parsed once and both alerts were emailed
+        mock_freezer_data.assert_called_once()
+        mock_freezer_data.return_value.parse_csv.assert_called_once_with(
+            "92.168.1.100")
+        self.assertEqual(mock_email.return_value.send_email.call_count, 2)
+
+if __name__ == "__main__":
+    unittest.main()
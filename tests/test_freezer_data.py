@@ -1,7 +1,9 @@
 # Standard library imports
-from collections import OrderedDict
 import csv
+import os
 import pathlib
+import shutil
+import tempfile
 import unittest
 from unittest import mock
 from unittest.mock import Mock
@@ -9,6 +11,7 @@ from unittest.mock import patch, call
 
 # Local application imports
 from app.FreezerData import FreezerData
+from app.FreezerData import FreezerRow
 
 class TestEmail(unittest.TestCase):
     """Test methods from FreezerData Class"""
@@ -27,14 +30,58 @@ class TestEmail(unittest.TestCase):
         freezer_data.parse_csv(ip)
 
         # Test result of parse
-        od = OrderedDict([('Freezer Number', '3'), 
-            ('Department', 'Chemistry'), ('PI', 'Person3'), 
-            ('Email', 'minus80-Person3@chem.umass.edu'), 
-            ('MFG', 'Thermo Fisher'), ('Model Number', 'TSU 500D'), 
-            ('Location', 'LGRT 3'), ('Jack Number', ''), 
-            ('IP', '92.168.1.100'), ('Hostname', 'minus80-Person3-1'), 
-            ('MAC', 'aa:bb:cc:dd:ee:ff'), ('Comments', ''), (None, [''])])
-        self.assertEqual(freezer_data.get_data(), od)
+        row = FreezerRow('LGRT 3', 'minus80-Person3@chem.umass.edu')
+        self.assertEqual(freezer_data.get_data(), row)
+
+    def test_parse_csv_reloads_modified_file(self):
+        """Tests FreezerData reparses CSV file after it has been modified"""
+
+        # Copy test data so it can be modified
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        csv_file = pathlib.Path(temp_dir).joinpath("freezer_test.csv")
+        shutil.copy(pathlib.Path.cwd().joinpath("tests", "freezer_test.csv"),
+            csv_file)
+        ip = "92.168.1.101"
+
+        # Parse freezer data for an IP not in the file
+        freezer_data = FreezerData(csv_file)
+        freezer_data.parse_csv(ip)
+        self.assertIsNone(freezer_data.get_data())
+
+        # Add a row for the IP and move modification time forward
+        with open(csv_file, "a", newline='') as file:
+            file.write("4,Chemistry,Person4,minus80-Person4@chem.umass.edu,"
+                "Thermo Fisher,TSU 500D,LGRT 4,,92.168.1.101,"
+                "minus80-Person4-1,aa:bb:cc:dd:ee:00,\n")
+        stat = os.stat(csv_file)
+        os.utime(csv_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        # Test result of parse after modification
+        freezer_data.parse_csv(ip)
+        self.assertEqual(freezer_data.get_data().location, "LGRT 4")
+
+    def test_parse_csv_duplicate_ip(self):
+        """Tests FreezerData uses first row for an IP listed more than once"""
+
+        # Copy test data and add a second row for an existing IP
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        csv_file = pathlib.Path(temp_dir).joinpath("freezer_test.csv")
+        shutil.copy(pathlib.Path.cwd().joinpath("tests", "freezer_test.csv"),
+            csv_file)
+        with open(csv_file, "a", newline='') as file:
+            file.write("5,Chemistry,Person5,minus80-Person5@chem.umass.edu,"
+                "Thermo Fisher,TSU 500D,LGRT 5,,92.168.1.100,"
+                "minus80-Person5-1,aa:bb:cc:dd:ee:01,\n")
+
+        # Parse freezer data
+        freezer_data = FreezerData(csv_file)
+        freezer_data.parse_csv("92.168.1.100")
+
+        # Test result of parse is the first row
+        row = FreezerRow('LGRT 3', 'minus80-Person3@chem.umass.edu')
+        self.assertEqual(freezer_data.get_data(), row)
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file